@@ -1,209 +1,344 @@
-from typing import Dict, Any, Tuple
-import math
+from typing import Dict, Any, List, Optional, Tuple
+from functools import lru_cache
+from types import MappingProxyType
+# Bound once so the hot scalar paths skip the math module attribute lookup
+from math import exp as _exp, log as _log
 import numpy as np
-from scipy.stats import entropy
+from aem_kernel import HAVE_NUMBA, SIGMOID_SCALE, normalize_kernel, score_all, score_kernel, sigmoid
+
+# Fixed metric order for every internal metric array; dicts are only built
+# at the public API boundary
+METRICS = (
+    'program_expense_ratio',
+    'fundraising_efficiency',
+    'revenue_sustainability',
+    'net_surplus_margin',
+    'executive_pay_reasonableness',
+    'transparency'
+)
+
+# Base weights in METRICS order, later adjusted by entropy
+BASE_WEIGHTS_ARR = np.array([0.3, 0.2, 0.15, 0.15, 0.1, 0.1])
+BASE_WEIGHTS_ARR.setflags(write=False)
+
+# log10(x) == log(x) * _INV_LN10; math.log is the cheaper call
+_INV_LN10 = 1.0 / _log(10.0)
+
+@lru_cache(maxsize=None)
+def _import_cupy():
+    """Import CuPy on first use, so CPU-only callers never pay for it.
+
+    Returns None if CuPy is not installed.
+    """
+    try:
+        import cupy
+    except ImportError:  # CuPy is optional; only calculate_aem_batch_gpu needs it
+        return None
+    return cupy
+
+def _array_module(x):
+    """Return the array module (NumPy or CuPy) that x belongs to."""
+    if isinstance(x, np.ndarray):
+        return np
+    cupy = _import_cupy()
+    return cupy.get_array_module(x) if cupy is not None else np
+
+def _gpu_expit(x):
+    """Logistic sigmoid of a CuPy array, computed on the device."""
+    from cupyx.scipy.special import expit
+    return expit(x)
+
+def _binary_entropy(p: np.ndarray) -> np.ndarray:
+    """Shannon entropy of the binary distribution [p, 1-p], element-wise."""
+    xp = _array_module(p)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        entropies = -(p * xp.log(p) + (1.0 - p) * xp.log1p(-p))
+    # Entropy is 0 at p in {0, 1}, where the formula above gives nan
+    entropies[(p <= 0.0) | (p >= 1.0)] = 0.0
+    return entropies
+
+# Governance policies in bit order for _fuzzy_policy_cached, with their weights.
+# These are the only policy weights: the cached scores are built from them.
+_POLICY_KEYS = (
+    'conflict_of_interest_policy',
+    'whistleblower_policy',
+    'document_retention_policy',
+    'compensation_review_process'
+)
+_POLICY_W = (0.3, 0.3, 0.2, 0.2)
+
+@lru_cache(maxsize=64)
+def _fuzzy_policy_cached(bits: int) -> float:
+    """Fuzzy policy score for a bitmask of implemented policies."""
+    score = sum(weight for i, weight in enumerate(_POLICY_W) if bits & (1 << i))
+    return 1 / (1 + _exp(-SIGMOID_SCALE * score))
 
 class AEMCalculator:
-    def __init__(self):
-        """Initialize the AEM calculator with advanced mathematical modeling."""
-        # Base weights that will be adjusted by entropy
-        self.base_weights = {
-            'program_expense_ratio': 0.3,
-            'fundraising_efficiency': 0.2,
-            'revenue_sustainability': 0.15,
-            'net_surplus_margin': 0.15,
-            'executive_pay_reasonableness': 0.1,
-            'transparency': 0.1
-        }
-        
-        # Constants for sigmoid normalization
-        self.sigmoid_shift = 0.5
-        self.sigmoid_scale = 10
+    # Column order of every metric array the calculator produces
+    METRIC_ORDER = METRICS
+    
+    # Default base weights, shared read-only by every instance
+    _DEFAULT_BASE_WEIGHTS = MappingProxyType(dict(zip(METRICS, BASE_WEIGHTS_ARR.tolist())))
+    
+    # Constant for sigmoid normalization
+    sigmoid_scale = SIGMOID_SCALE
+
+    def __init__(self, base_weights: Optional[Dict[str, float]] = None):
+        """Initialize the AEM calculator with advanced mathematical modeling.
         
-        # Fuzzy logic parameters for policy evaluation
-        self.policy_weights = {
-            'conflict_of_interest_policy': 0.3,
-            'whistleblower_policy': 0.3,
-            'document_retention_policy': 0.2,
-            'compensation_review_process': 0.2
-        }
+        Args:
+            base_weights: Optional custom base weights keyed by metric name
+        """
+        # Scratch buffers reused by every single-organization call, so one
+        # instance should not be shared between threads
+        self._raw_buf = np.empty(len(METRICS))
+        self._norm_buf = np.empty(len(METRICS))
+        self._entropy_buf = np.empty(len(METRICS))
+        
+        # Base weights that will be adjusted by entropy; only copied when overridden
+        if base_weights:
+            self.base_weights = base_weights
+        else:
+            self._base_weights = self._DEFAULT_BASE_WEIGHTS
+            self._base_weights_arr = BASE_WEIGHTS_ARR
+            self._weights_total = float(BASE_WEIGHTS_ARR.sum()) + 1.0
+
+    @property
+    def base_weights(self) -> Dict[str, float]:
+        """Base weights keyed by metric name (read-only; assign a new mapping to change)."""
+        return self._base_weights
+
+    @base_weights.setter
+    def base_weights(self, weights: Dict[str, float]) -> None:
+        # Convert to the kernel's array layout once, here, rather than on every score
+        self._base_weights = MappingProxyType(dict(weights))
+        self._base_weights_arr = np.array([weights[metric] for metric in METRICS])
+        self._base_weights_arr.setflags(write=False)
+        # Entropy weights always sum to 1, so every organization's combined
+        # (base + entropy) weights share this total
+        self._weights_total = float(self._base_weights_arr.sum()) + 1.0
 
-    def _multi_dimensional_normalization(self, metrics: Dict[str, float]) -> Dict[str, float]:
-        """Apply multi-dimensional normalization using Mahalanobis distance principles."""
-        # Convert metrics to numpy array
-        values = np.array(list(metrics.values()))
+    def _multi_dimensional_normalization(self, metrics: np.ndarray) -> np.ndarray:
+        """Apply multi-dimensional normalization using Mahalanobis distance principles.
+
+        Operates row-wise on an (N, 6) array of raw metrics, one row per organization,
+        held in host (NumPy) or device (CuPy) memory.
+        """
+        xp = _array_module(metrics)
         
-        # Handle case where all values are the same
-        if np.all(values == values[0]):
-            return {metric: 0.5 for metric in metrics.keys()}
-            
-        # Calculate mean and standard deviation
-        mean = np.mean(values)
-        std = np.std(values)
+        # Calculate mean and standard deviation of each organization's metrics,
+        # reusing the centered values for the z-scores
+        centered = metrics - metrics.mean(axis=1, keepdims=True)
+        std = xp.sqrt(xp.einsum('ij,ij->i', centered, centered) / metrics.shape[1])[:, None]
+        
+        # Rows where all values are the same (or std is 0) have nothing to normalize
+        flat = xp.all(metrics == metrics[:, :1], axis=1) | (std[:, 0] == 0)
         
-        # Handle case where std is 0
-        if std == 0:
-            return {metric: 0.5 for metric in metrics.keys()}
-            
         # Apply z-score normalization with clipping to prevent extreme values
-        z_scores = np.clip((values - mean) / std, -3, 3)
+        z_scores = xp.clip(centered / xp.where(flat[:, None], 1.0, std), -3, 3)
         
         # Convert back to sigmoid space
-        normalized = {}
-        for metric, z_score in zip(metrics.keys(), z_scores):
-            normalized[metric] = self._sigmoid_normalization(z_score)
-            
+        if xp is np:
+            normalized = sigmoid(z_scores)
+        else:
+            normalized = _gpu_expit(SIGMOID_SCALE * z_scores)
+        normalized[flat] = 0.5
+        
         return normalized
 
-    def _calculate_entropy_weights(self, metrics: Dict[str, float]) -> Dict[str, float]:
-        """Calculate weights based on Shannon entropy of each metric."""
+    def _calculate_entropy_weights(self, metrics: np.ndarray) -> np.ndarray:
+        """Calculate weights based on Shannon entropy of each metric.
+
+        Operates row-wise on an (N, 6) array of raw metrics, one row per organization,
+        held in host (NumPy) or device (CuPy) memory.
+        """
         # Add small constant to prevent zero values
         epsilon = 1e-10
-        adjusted_metrics = {k: v + epsilon for k, v in metrics.items()}
+        adjusted_metrics = metrics + epsilon
         
         # Convert to probabilities
-        total = sum(adjusted_metrics.values())
-        probabilities = {k: v/total for k, v in adjusted_metrics.items()}
+        probabilities = adjusted_metrics / adjusted_metrics.sum(axis=1, keepdims=True)
         
-        # Calculate entropy for each metric
-        entropies = {}
-        for metric, prob in probabilities.items():
-            # Create a binary distribution for the metric
-            dist = [prob, 1-prob]
-            entropies[metric] = entropy(dist)
+        # Calculate entropy of the binary distribution [p, 1-p] for each metric
+        entropies = _binary_entropy(probabilities)
         
         # Calculate inverse entropy weights (higher weight for lower entropy)
-        max_entropy = max(entropies.values())
-        inverse_entropies = {metric: (max_entropy - e + epsilon) 
-                            for metric, e in entropies.items()}
+        max_entropy = entropies.max(axis=1, keepdims=True)
+        inverse_entropies = max_entropy - entropies + epsilon
         
         # Normalize inverse entropies to get weights
-        total_inverse = sum(inverse_entropies.values())
-        if total_inverse == 0:
-            return self.base_weights
-            
-        weights = {metric: (inv_e + epsilon)/(total_inverse + len(entropies)*epsilon) 
-                  for metric, inv_e in inverse_entropies.items()}
-        
-        return weights
+        total_inverse = inverse_entropies.sum(axis=1, keepdims=True)
+        return (inverse_entropies + epsilon) / (total_inverse + metrics.shape[1] * epsilon)
 
     def _fuzzy_policy_evaluation(self, policies: Dict[str, bool]) -> float:
         """Evaluate policies using fuzzy logic."""
         if not policies:
             return 0.0
             
-        # Calculate weighted sum of policies
-        score = sum(
-            weight * (1.0 if policy else 0.0)
-            for policy, weight in zip(policies.values(), self.policy_weights.values())
-        )
-        
-        # Apply sigmoid to get smooth transition
-        return self._sigmoid_normalization(score)
-
-    def calculate_aem(self, financials: Dict[str, Any]) -> Tuple[float, Dict[str, float]]:
-        """Calculate the Altruistic Effectiveness Metric (AEM) score with component scores."""
-        # Calculate raw metrics
-        raw_metrics = {
-            'program_expense_ratio': self._calculate_program_expense_ratio(financials),
-            'fundraising_efficiency': self._calculate_fundraising_efficiency(financials),
-            'revenue_sustainability': self._calculate_revenue_sustainability(financials),
-            'net_surplus_margin': self._calculate_net_surplus_margin(financials),
-            'executive_pay_reasonableness': self._calculate_executive_pay_reasonableness(financials),
-            'transparency': self._fuzzy_policy_evaluation(financials.get('policies', {}))
-        }
-        
-        # Calculate entropy-based weights
-        entropy_weights = self._calculate_entropy_weights(raw_metrics)
-        
-        # Apply multi-dimensional normalization
-        normalized_metrics = self._multi_dimensional_normalization(raw_metrics)
+        # Pack implemented policies into a bitmask; there are only 16 patterns,
+        # so the weighted sum and sigmoid are cached per pattern
+        bits = sum(1 << i for i, policy in enumerate(_POLICY_KEYS) if policies.get(policy))
+        return _fuzzy_policy_cached(bits)
+
+    def calculate_aem(self, financials: Dict[str, Any],
+                      _raw: Optional[np.ndarray] = None) -> Tuple[float, Dict[str, float]]:
+        """Calculate the Altruistic Effectiveness Metric (AEM) score with component scores.
         
-        # Calculate final weights by combining base weights and entropy weights
-        final_weights = {
-            metric: (self.base_weights[metric] + entropy_weights[metric]) / 2
-            for metric in self.base_weights
-        }
+        Args:
+            financials: Organization's financial data
+            _raw: Raw metrics already computed by _compute_raw_metrics, if any
+        """
+        raw_metrics = _raw if _raw is not None else self._compute_raw_metrics(financials, out=self._raw_buf)
+        aem_score = score_kernel(raw_metrics, self._base_weights_array(), self._norm_buf, self._entropy_buf)
+
+        return float(aem_score), dict(zip(METRICS, self._norm_buf.tolist()))
+
+    def _compute_raw_metrics(self, financials: Dict[str, Any], out: Optional[np.ndarray] = None) -> np.ndarray:
+        """Calculate the raw metrics of one organization as an array in METRICS order.
         
-        # Normalize final weights
-        total_weight = sum(final_weights.values())
-        final_weights = {metric: weight/total_weight for metric, weight in final_weights.items()}
+        All six metrics are computed inline from fields read once into locals;
+        per-metric helper calls cost more than the arithmetic they wrap.
         
-        # Calculate weighted sum
-        aem_score = sum(
-            weight * score
-            for weight, score in zip(final_weights.values(), normalized_metrics.values())
-        )
+        Args:
+            financials: Organization's financial data
+            out: Optional 6-element array to fill instead of allocating a new one
+        """
+        raw = np.empty(len(METRICS)) if out is None else out
+        sig = self._sigmoid_normalization
+        total_revenue = financials['total_revenue']
+        total_expenses = financials['total_expenses']
         
-        return aem_score, normalized_metrics
-
-    def _calculate_program_expense_ratio(self, financials: Dict[str, Any]) -> float:
-        """Calculate the ratio of program expenses to total expenses."""
-        # Use pre-calculated ratio if available
+        # Program expense ratio, with 0.6 as ideal; use pre-calculated ratio if available
         if 'program_expense_ratio' in financials:
-            ratio = financials['program_expense_ratio']
-            # Normalize to 0-1 range with 0.6 as ideal
-            return self._sigmoid_normalization(ratio - 0.6)
-            
-        if 'largest_program_expenses' not in financials or financials['total_expenses'] == 0:
-            return 0.0
-        
-        total_program_expenses = sum(
-            program.get('expenses', 0)
-            for program in financials['largest_program_expenses'].values()
-        )
-        ratio = total_program_expenses / financials['total_expenses']
-        # Normalize to 0-1 range with 0.6 as ideal
-        return self._sigmoid_normalization(ratio - 0.6)
-
-    def _calculate_fundraising_efficiency(self, financials: Dict[str, Any]) -> float:
-        """Calculate and normalize fundraising efficiency."""
-        # Use pre-calculated efficiency if available
+            raw[0] = sig(financials['program_expense_ratio'] - 0.6)
+        else:
+            programs = financials.get('largest_program_expenses')
+            if programs is None or total_expenses == 0:
+                raw[0] = 0.0
+            else:
+                total_program_expenses = 0
+                for program in programs.values():
+                    expenses = program.get('expenses')
+                    if expenses:
+                        total_program_expenses += expenses
+                raw[0] = sig(total_program_expenses / total_expenses - 0.6)
+        
+        # Fundraising efficiency on a log scale (ideal around 10); use
+        # pre-calculated efficiency if available
         if 'fundraising_efficiency' in financials:
-            efficiency = financials['fundraising_efficiency']
-            # Normalize efficiency score (ideal around 10)
-            # Use log scale to better handle high values
-            return self._sigmoid_normalization(math.log10(efficiency) - 0.8)
-            
-        if financials['fundraising_expenses'] == 0:
-            return 0.0
-        
-        efficiency = financials['contributions_and_grants'] / financials['fundraising_expenses']
-        return self._sigmoid_normalization(math.log10(efficiency) - 0.8)
+            raw[1] = sig(_log(financials['fundraising_efficiency']) * _INV_LN10 - 0.8)
+        else:
+            fundraising_expenses = financials['fundraising_expenses']
+            if fundraising_expenses == 0:
+                raw[1] = 0.0
+            else:
+                efficiency = financials['contributions_and_grants'] / fundraising_expenses
+                raw[1] = sig(_log(efficiency) * _INV_LN10 - 0.8)
+        
+        if total_revenue == 0:
+            raw[2] = 0.0
+            raw[3] = 0.0
+        else:
+            # Program service revenue share, with 0.5 as ideal
+            raw[2] = sig(financials['program_service_revenue'] / total_revenue - 0.5)
+            # Net surplus margin, with 0.05 (5%) as ideal
+            raw[3] = sig((total_revenue - total_expenses) / total_revenue - 0.05)
+        
+        # Executive pay reasonableness: top salary as a share of total expenses,
+        # with 0.015 (1.5%) as ideal and 0.5 (neutral) if there is no data.
+        # Use pre-computed top salary if available
+        top_salary = financials.get('top_individual_salary')
+        if top_salary is None:
+            salaries = financials.get('top_individual_salaries')
+            if salaries:
+                top_salary = 0
+                for salary in salaries.values():
+                    if salary > top_salary:
+                        top_salary = salary
+        if top_salary is None or total_expenses == 0:
+            raw[4] = 0.5
+        else:
+            raw[4] = sig(0.015 - top_salary / total_expenses)
+        
+        raw[5] = self._fuzzy_policy_evaluation(financials.get('policies', {}))
+        return raw
 
-    def _calculate_revenue_sustainability(self, financials: Dict[str, Any]) -> float:
-        """Calculate the ratio of program service revenue to total revenue."""
-        if financials['total_revenue'] == 0:
-            return 0.0
-        ratio = financials['program_service_revenue'] / financials['total_revenue']
-        # Normalize to 0-1 range with 0.5 as ideal
-        return self._sigmoid_normalization(ratio - 0.5)
+    def _base_weights_array(self) -> np.ndarray:
+        """Return the base weights as an array in METRICS order."""
+        return self._base_weights_arr
 
-    def _calculate_net_surplus_margin(self, financials: Dict[str, Any]) -> float:
-        """Calculate the net surplus margin."""
-        if financials['total_revenue'] == 0:
-            return 0.0
-        margin = (financials['total_revenue'] - financials['total_expenses']) / financials['total_revenue']
-        # Normalize margin to 0-1 range, with 0.05 (5%) as ideal
-        return self._sigmoid_normalization(margin - 0.05)
+    def calculate_aem_batch(self, financials_list: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate AEM scores for many organizations at once.
+        
+        Args:
+            financials_list: Financial data for each organization
+            
+        Returns:
+            Tuple of an (N,) array of AEM scores and an (N, 6) array of
+            normalized component scores, with columns ordered as in METRICS
+        """
+        # Calculate raw metrics for every organization
+        raw_metrics = self._extract_raw_metrics_batch(financials_list)
+        
+        # With Numba, score the rows in parallel with the compiled kernel;
+        # otherwise fall back to whole-array NumPy operations
+        if HAVE_NUMBA:
+            return score_all(raw_metrics, self._base_weights_array())
+        return self._score_batch(raw_metrics)
 
-    def _calculate_executive_pay_reasonableness(self, financials: Dict[str, Any]) -> float:
-        """Calculate the reasonableness of executive pay using advanced statistical methods."""
-        if not financials.get('top_individual_salaries') or financials['total_expenses'] == 0:
-            return 0.5  # Neutral score if no data
+    def calculate_aem_batch_gpu(self, financials_list: List[Dict[str, Any]]) -> Tuple[np.ndarray, np.ndarray]:
+        """Calculate AEM scores for many organizations at once on a CUDA GPU.
         
-        top_salary = max(financials['top_individual_salaries'].values())
-        total_expenses = financials['total_expenses']
+        Raw metrics are extracted on the host and scored on the device with
+        CuPy, which pays off for large batches (thousands of organizations).
+        
+        Args:
+            financials_list: Financial data for each organization
+            
+        Returns:
+            Same as calculate_aem_batch, copied back to host memory
+        """
+        cupy = _import_cupy()
+        if cupy is None:
+            raise ImportError("CuPy not found. Install it with: pip install cupy-cuda12x")
+        raw_metrics = cupy.asarray(self._extract_raw_metrics_batch(financials_list))
+        aem_scores, normalized_metrics = self._score_batch(raw_metrics)
+        return cupy.asnumpy(aem_scores), cupy.asnumpy(normalized_metrics)
+
+    def _score_batch(self, raw_metrics: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Score an (N, 6) array of raw metrics with whole-array operations.
+        
+        Runs on whichever array module holds raw_metrics, NumPy or CuPy.
+        """
+        xp = _array_module(raw_metrics)
+        
+        # Calculate entropy-based weights
+        entropy_weights = self._calculate_entropy_weights(raw_metrics)
+        
+        # Apply multi-dimensional normalization
+        normalized_metrics = self._multi_dimensional_normalization(raw_metrics)
+        
+        # Calculate final weights by combining base weights and entropy weights,
+        # normalized by their shared total (no per-row sum needed)
+        final_weights = xp.asarray(self._base_weights_array()) + entropy_weights
+        final_weights /= self._weights_total
+        
+        # Calculate weighted sum of each row without an (N, 6) temporary
+        aem_scores = xp.einsum('ij,ij->i', final_weights, normalized_metrics)
         
-        # Calculate ratio and normalize
-        ratio = top_salary / total_expenses
-        # Ideal ratio is around 0.015 (1.5% of total expenses)
-        return self._sigmoid_normalization(0.015 - ratio)
+        return aem_scores, normalized_metrics
+
+    def _extract_raw_metrics_batch(self, financials_list: List[Dict[str, Any]]) -> np.ndarray:
+        """Build an (N, 6) array of raw metrics, one row per organization."""
+        raw = np.empty((len(financials_list), len(METRICS)))
+        for row, financials in zip(raw, financials_list):
+            self._compute_raw_metrics(financials, out=row)
+        return raw
 
     def _sigmoid_normalization(self, x: float) -> float:
         """Apply sigmoid normalization to a value."""
         # Adjust sigmoid parameters for better distribution
-        return 1 / (1 + math.exp(-3 * x))  # Reduced scale for smoother transition
+        return 1 / (1 + _exp(-SIGMOID_SCALE * x))
 
     def sensitivity_analysis(self, financials: Dict[str, Any], variation: float = 0.2) -> Dict[str, float]:
         """Perform sensitivity analysis by varying component weights.
@@ -215,22 +350,26 @@ class AEMCalculator:
         Returns:
             Dictionary mapping each component to its sensitivity score
         """
-        base_score, _ = self.calculate_aem(financials)
-        results = {}
-        
-        # Test each component weight
-        for metric in self.base_weights:
-            # Create modified calculator with adjusted weight
-            modified_weights = self.base_weights.copy()
-            modified_weights[metric] *= (1 + variation)
-            modified_calc = AEMCalculator()
-            modified_calc.base_weights = modified_weights
-            
-            # Calculate new score
-            new_score, _ = modified_calc.calculate_aem(financials)
-            results[metric] = abs(new_score - base_score)
-        
-        return results
+        # Raw metrics, normalization and entropy weights do not depend on the
+        # base weights, so compute them only once
+        raw_metrics = self._compute_raw_metrics(financials, out=self._raw_buf)
+        normalized_metrics = normalize_kernel(raw_metrics, self._norm_buf)
+        entropy_weights = self._calculate_entropy_weights(raw_metrics[np.newaxis])[0]
+        
+        # Column 0 holds the unmodified base weights; column k + 1 scales
+        # metric k by (1 + variation)
+        n = len(METRICS)
+        weights = np.tile(self._base_weights_array()[:, np.newaxis], (1, n + 1))
+        weights[np.arange(n), np.arange(1, n + 1)] *= (1 + variation)
+        
+        # Combine with entropy weights (which sum to 1) and normalize each column
+        weights_total = weights.sum(axis=0) + 1.0
+        weights += entropy_weights[:, np.newaxis]
+        weights /= weights_total
+        
+        # Score every weighting in one product
+        scores = normalized_metrics @ weights
+        return dict(zip(METRICS, np.abs(scores[1:] - scores[0]).tolist()))
 
     def analyze_components(self, financials: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze how each component contributes to the final score.
@@ -241,18 +380,18 @@ class AEMCalculator:
         Returns:
             Dictionary containing total score, component scores, and contributions
         """
-        score, components = self.calculate_aem(financials)
+        base_weights = self._base_weights_array()
+        raw_metrics = self._compute_raw_metrics(financials, out=self._raw_buf)
+        score = score_kernel(raw_metrics, base_weights, self._norm_buf, self._entropy_buf)
+        components = self._norm_buf
         
         # Calculate contribution of each component
-        contributions = {}
-        for metric, comp_score in components.items():
-            weight = self.base_weights[metric]
-            contributions[metric] = weight * comp_score
+        contributions = base_weights * components
         
         return {
-            'total_score': score,
-            'component_scores': components,
-            'contributions': contributions
+            'total_score': float(score),
+            'component_scores': dict(zip(METRICS, components.tolist())),
+            'contributions': dict(zip(METRICS, contributions.tolist()))
         }
 
     def analyze_normalization(self, financials: Dict[str, Any]) -> Dict[str, Any]:
@@ -265,20 +404,13 @@ class AEMCalculator:
             Dictionary containing raw metrics, normalized metrics, and final score
         """
         # Get raw metrics before normalization
-        raw_metrics = {
-            'program_expense_ratio': self._calculate_program_expense_ratio(financials),
-            'fundraising_efficiency': self._calculate_fundraising_efficiency(financials),
-            'revenue_sustainability': self._calculate_revenue_sustainability(financials),
-            'net_surplus_margin': self._calculate_net_surplus_margin(financials),
-            'executive_pay_reasonableness': self._calculate_executive_pay_reasonableness(financials),
-            'transparency': self._fuzzy_policy_evaluation(financials.get('policies', {}))
-        }
+        raw_metrics = self._compute_raw_metrics(financials)
         
-        # Get normalized scores
-        score, normalized_metrics = self.calculate_aem(financials)
+        # Get normalized scores without re-extracting the raw metrics
+        score, normalized_metrics = self.calculate_aem(financials, _raw=raw_metrics)
         
         return {
-            'raw_metrics': raw_metrics,
+            'raw_metrics': dict(zip(METRICS, raw_metrics.tolist())),
             'normalized_metrics': normalized_metrics,
             'final_score': score
         }
@@ -293,11 +425,23 @@ class AEMCalculator:
         Returns:
             Dictionary containing scores and components for both schools
         """
-        # Calculate scores for both schools
-        school1_score, school1_components = self.calculate_aem(school1_data)
-        school2_score, school2_components = self.calculate_aem(school2_data)
+        return self.cross_validate_schools_batch([school1_data, school2_data])
+
+    def cross_validate_schools_batch(self, schools: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Compare AEM scores across any number of schools.
+        
+        Args:
+            schools: Financial data for each school
+            
+        Returns:
+            Dictionary containing scores and components for every school
+        """
+        scores, components = self.calculate_aem_batch(schools)
         
         return {
-            school1_data['organization_name']: {'score': school1_score, 'components': school1_components},
-            school2_data['organization_name']: {'score': school2_score, 'components': school2_components}
-        } 
\ No newline at end of file
+            school['organization_name']: {
+                'score': float(score),
+                'components': dict(zip(METRICS, school_components.tolist()))
+            }
+            for school, score, school_components in zip(schools, scores, components)
+        }
@@ -0,0 +1,183 @@
+"""Numerical kernels for the AEM calculator.
+
+The kernels work on fixed-order metric arrays (see ``aem_calculator.METRICS``)
+and are compiled to native code with Numba when it is installed. Without
+Numba they run unchanged as plain Python.
+"""
+
+import math
+import numpy as np
+
+try:
+    from numba import njit, prange, vectorize
+    HAVE_NUMBA = True
+except ImportError:  # Numba is optional; fall back to plain Python
+    HAVE_NUMBA = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for ``numba.njit`` that returns the function unchanged."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+# Steepness of the sigmoid used for every normalization step. A module-level
+# constant, so Numba folds it into the compiled kernels as a literal.
+SIGMOID_SCALE = 3.0
+
+
+if HAVE_NUMBA:
+    @vectorize(['float64(float64)'], cache=True, fastmath=True)
+    def sigmoid(x):
+        """Sigmoid normalization as a ufunc over scalars or arrays of any shape."""
+        return 1.0 / (1.0 + math.exp(-SIGMOID_SCALE * x))
+else:
+    def sigmoid(x):
+        """Sigmoid normalization over scalars or arrays of any shape.
+
+        Works in place on a single temporary instead of allocating one array
+        per operation.
+        """
+        out = np.multiply(x, -SIGMOID_SCALE, dtype=np.float64)
+        if np.ndim(out) == 0:
+            return 1.0 / (1.0 + np.exp(out))
+        np.exp(out, out=out)
+        out += 1.0
+        return np.reciprocal(out, out=out)
+
+
+@njit(cache=True, fastmath=True)
+def _has_spread(vals):
+    """Return False if every value in vals is identical."""
+    for i in range(1, vals.shape[0]):
+        if vals[i] != vals[0]:
+            return True
+    return False
+
+
+@njit(cache=True, fastmath=True)
+def _meanstd6(a):
+    """Mean and population standard deviation of a 6-element array.
+
+    Unrolled so the compiled code is straight-line arithmetic.
+    """
+    mean = (a[0] + a[1] + a[2] + a[3] + a[4] + a[5]) / 6.0
+    d0 = a[0] - mean
+    d1 = a[1] - mean
+    d2 = a[2] - mean
+    d3 = a[3] - mean
+    d4 = a[4] - mean
+    d5 = a[5] - mean
+    var = (d0 * d0 + d1 * d1 + d2 * d2 + d3 * d3 + d4 * d4 + d5 * d5) / 6.0
+    return mean, math.sqrt(var)
+
+
+@njit(cache=True, fastmath=True)
+def normalize_kernel(vals, out):
+    """Z-score, clip and sigmoid-normalize the six metrics in vals into out.
+
+    The z-score, clip and sigmoid are fused into a single loop. A vector
+    without spread maps to 0.5. Returns out.
+    """
+    if not _has_spread(vals):
+        out[:] = 0.5
+        return out
+
+    mean, std = _meanstd6(vals)
+    if std == 0.0:
+        out[:] = 0.5
+        return out
+
+    for i in range(6):
+        z = (vals[i] - mean) / std
+        if z < -3.0:
+            z = -3.0
+        elif z > 3.0:
+            z = 3.0
+        out[i] = 1.0 / (1.0 + math.exp(-SIGMOID_SCALE * z))
+    return out
+
+
+@njit(cache=True, fastmath=True)
+def score_kernel(raw, base_w, norm, inverse):
+    """Score one organization from its raw metrics.
+
+    Args:
+        raw: float64 array of raw metrics in METRICS order
+        base_w: float64 array of base weights in METRICS order
+        norm: float64 array the normalized metrics are written into
+        inverse: float64 scratch array, same length as raw, for the entropy
+            weights; passed in so scoring allocates nothing
+
+    Returns:
+        The AEM score
+    """
+    n = raw.shape[0]
+    epsilon = 1e-10
+
+    # A flat metric vector normalizes to 0.5 everywhere and, since the final
+    # weights sum to 1, so does the score: skip normalization and entropy
+    # weighting entirely. Only an exactly flat vector qualifies; entropy
+    # weights depend on the differences between metrics, not their scale,
+    # so even a tiny spread can move the weights a long way.
+    if not _has_spread(raw):
+        norm[:] = 0.5
+        return 0.5
+    normalize_kernel(raw, norm)
+
+    # Entropy of the binary distribution [p, 1-p] for each metric
+    total = 0.0
+    for i in range(n):
+        total += raw[i] + epsilon
+    max_entropy = 0.0
+    for i in range(n):
+        p = (raw[i] + epsilon) / total
+        if p <= 0.0 or p >= 1.0:
+            h = 0.0
+        else:
+            h = -p * math.log(p) - (1.0 - p) * math.log1p(-p)
+        inverse[i] = h
+        if h > max_entropy:
+            max_entropy = h
+
+    # Inverse entropy weights (higher weight for lower entropy)
+    total_inverse = 0.0
+    for i in range(n):
+        inverse[i] = max_entropy - inverse[i] + epsilon
+        total_inverse += inverse[i]
+
+    # Combine base and entropy weights and take the weighted sum. The entropy
+    # weights sum to 1, so the combined weights always total sum(base_w) + 1
+    # and are normalized once at the end.
+    entropy_scale = 1.0 / (total_inverse + n * epsilon)
+    weighted_sum = 0.0
+    base_total = 0.0
+    for i in range(n):
+        entropy_weight = (inverse[i] + epsilon) * entropy_scale
+        weighted_sum += (base_w[i] + entropy_weight) * norm[i]
+        base_total += base_w[i]
+
+    return weighted_sum / (base_total + 1.0)
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def score_all(raw, base_w):
+    """Score many organizations in parallel.
+
+    Args:
+        raw: (N, 6) float64 array of raw metrics, one row per organization
+        base_w: float64 array of base weights in METRICS order
+
+    Returns:
+        Tuple of the (N,) score array and the (N, 6) normalized metric array
+    """
+    n_orgs = raw.shape[0]
+    scores = np.empty(n_orgs)
+    norms = np.empty(raw.shape)
+    # Entropy scratch for every row, allocated once for the whole batch
+    inverse = np.empty(raw.shape)
+    # Rows are independent, so each one can be scored on its own thread
+    for i in prange(n_orgs):
+        scores[i] = score_kernel(raw[i], base_w, norms[i], inverse[i])
+    return scores, norms
@@ -1,29 +1,58 @@
 import argparse
 import json
 import os
+from typing import Any, Dict
 from aem_calculator import AEMCalculator
 
-def main(input_file: str):
+try:
+    import orjson  # Faster JSON parsing when available
+except ImportError:
+    orjson = None
+
+# Parsed data files keyed by (path, modification time)
+_cache = {}
+
+def load_financial_data(input_file: str) -> Dict[str, Any]:
+    """Load an organization's financial data from a JSON file.
+    
+    Parsed files are cached for the life of the process and re-read only when
+    the file's modification time changes, so the returned dict is shared and
+    should not be modified.
+    """
+    key = (os.path.abspath(input_file), os.stat(input_file).st_mtime_ns)
+    if key not in _cache:
+        if orjson is not None:
+            with open(input_file, 'rb') as file:
+                _cache[key] = orjson.loads(file.read())
+        else:
+            with open(input_file, 'r', encoding='utf-8') as file:
+                _cache[key] = json.load(file)
+    return _cache[key]
+
+def main(input_file: str, device: str = 'cpu'):
     try:
         # First check if file exists
         if not os.path.exists(input_file):
             print(f"Error: File '{input_file}' not found")
             return
             
-        # Try to read the file with explicit encoding
-        with open(input_file, 'r', encoding='utf-8') as file:
-            financials = json.load(file)
-            
-            # Calculate AEM score
-            calculator = AEMCalculator()
+        financials = load_financial_data(input_file)
+        
+        # Calculate AEM score
+        calculator = AEMCalculator()
+        if device == 'cuda':
+            scores, normalized = calculator.calculate_aem_batch_gpu([financials])
+            aem_score = float(scores[0])
+            component_scores = dict(zip(calculator.METRIC_ORDER, normalized[0].tolist()))
+        else:
             aem_score, component_scores = calculator.calculate_aem(financials)
-            
-            print(f"\nAEM Analysis Results:")
-            print(f"Organization: {financials.get('organization_name', 'Unknown')}")
-            print(f"AEM Score: {aem_score:.3f}")
-            print("\nComponent Scores:")
-            for metric, score in component_scores.items():
-                print(f"{metric.replace('_', ' ').title()}: {score:.3f}")
+        
+        print(f"\nAEM Analysis Results:")
+        print(f"Organization: {financials.get('organization_name', 'Unknown')}")
+        print(f"AEM Score: {aem_score:.3f}")
+        print("\nComponent Scores:")
+        for metric, score in component_scores.items():
+            print(f"{metric.replace('_', ' ').title()}: {score:.3f}")
             
     except json.JSONDecodeError as e:
         print(f"Error parsing JSON: {str(e)}")
@@ -37,8 +66,10 @@ def main(input_file: str):
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description='Calculate AEM score for a given financial data file.')
     parser.add_argument('input_file', type=str, help='Path to the financial data file (JSON format)')
+    parser.add_argument('--device', choices=['cpu', 'cuda'], default='cpu',
+                        help='Where to run the scoring; cuda requires CuPy (default: cpu)')
     args = parser.parse_args()
-    main(args.input_file)
+    main(args.input_file, args.device)
 
 
 
@@ -10,11 +10,14 @@ Dependencies:
     pip install pymupdf==1.22.5
 Usage:
     python convert_990_to_json.py /path/to/form990.pdf /path/to/output.json
+    python convert_990_to_json.py /path/to/pdf_dir/ /path/to/output_dir/
 """
 
+import os
 import sys
 import json
 import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 
@@ -27,6 +30,69 @@ except ImportError as e:
 
 NUM_PATTERN = re.compile(r"([-]?[\d,.]+)")
 
+_FLAGS = re.IGNORECASE | re.MULTILINE
+
+# Numeric fields, each captured by group 1 of its own precompiled pattern.
+# Separate patterns keep the engine's fast literal-prefix search on each
+# label; one alternation of all of them would try every branch at every
+# character.
+_FIELDS = {
+    name: re.compile(pattern, _FLAGS)
+    for name, pattern in [
+        ("website", r"Website:\s*([\w.:-]+)"),
+        ("gross_receipts", r"Gross\s+receipts\s*\$?\s*([\d,]+)"),
+        ("total_revenue", r"Total\s+revenue[^\n]*\n[^\d-]*([\d,]+)"),
+        ("total_expenses", r"Total\s+expenses[^\n]*\n[^\d-]*([\d,]+)"),
+        ("revenue_less_expenses", r"Revenue\s+less\s+expenses[^\n]*\n[^\d-]*([\d,()-]+)"),
+        ("contributions_and_grants", r"Contributions\s+and\s+grants[^\n]*\n[^\d-]*([\d,]+)"),
+        ("program_service_revenue", r"Program\s+service\s+revenue[^\n]*\n[^\d-]*([\d,]+)"),
+        ("investment_income", r"Investment\s+income[^\n]*\n[^\d-]*([\d,]+)"),
+        ("other_revenue", r"Other\s+revenue[^\n]*\n[^\d-]*([-\d,]+)"),
+        ("grants_and_similar_amounts_paid", r"Grants\s+and\s+similar\s+amounts\s+paid[^\n]*\n[^\d-]*([\d,]+)"),
+        ("salaries_and_employee_benefits", r"Salaries.*?employee\s+benefits[^\n]*\n[^\d-]*([\d,]+)"),
+        ("other_expenses", r"Other\s+expenses[^\n]*\n[^\d-]*([\d,]+)"),
+        ("fundraising_expenses", r"fundraising\s+expenses[^\n]*\n[^\d-]*([\d,]+)"),
+        ("number_of_employees", r"individuals\s+employed[^\d]*([\d,]+)"),
+        ("number_of_volunteers", r"volunteers[^\d]*([\d,]+)"),
+        ("unrelated_business_income", r"Total\s+unrelated\s+business\s+revenue[^\d]*([\d,]+)"),
+        ("net_unrelated_business_income", r"Net\s+unrelated\s+business\s+taxable\s+income[^\d]*([\d,]+)"),
+    ]
+}
+
+# Beginning/end-of-year pairs, which start at the same anchor ("Total assets", ...)
+_PAIRED_FIELDS = {
+    name: re.compile(pattern, _FLAGS)
+    for name, pattern in [
+        ("total_assets_beginning", r"Total\s+assets[^\n]*\n[^\d-]*([\d,]+)\s+\n+[^\n]*End"),
+        ("total_assets_end", r"Total\s+assets[^\n]*End[^\d-]*([\d,]+)"),
+        ("total_liabilities_beginning", r"Total\s+liabilities[^\n]*\n[^\d-]*([\d,]+)\s+\n+[^\n]*End"),
+        ("total_liabilities_end", r"Total\s+liabilities[^\n]*End[^\d-]*([\d,]+)"),
+        ("net_assets_beginning", r"Net\s+assets[^\n]*\n[^\d-]*([\d,]+)\s+\n+[^\n]*End"),
+        ("net_assets_end", r"Net\s+assets[^\n]*End[^\d-]*([\d,]+)"),
+    ]
+}
+
+# Yes/no fields, set when their phrase appears anywhere in the form
+_FLAG_PATTERNS = {
+    "investment_in_securities": re.compile(r"investments—other\s+securities", re.IGNORECASE),
+    "land_buildings_and_equipment": re.compile(r"amount\s+for\s+land,\s+buildings,\s+and\s+equipment", re.IGNORECASE),
+    "audited_financials": re.compile(r"independent\s+audited\s+financial\s+statements", re.IGNORECASE),
+}
+
+_ORG_NAME = re.compile(r"^\s*([A-Z][A-Z\s&',.-]+)\s*Name of organization", re.MULTILINE)
+_MISSION = re.compile(r"mission['’]s?[^:]*:[\s\n]*(.+?)\n", re.IGNORECASE)
+_FISCAL_YEAR = re.compile(
+    r"for the (\d{4}) calendar year, or tax year beginning (\d{2})-(\d{2})-(\d{4})[ ,]+and ending (\d{2})-(\d{2})-(\d{4})"
+)
+
+# Patterns searched on their own, page by page; the first page with a match wins
+_PAGE_PATTERNS = {
+    "organization_name": _ORG_NAME,
+    "mission": _MISSION,
+    "fiscal_year": _FISCAL_YEAR,
+    **_PAIRED_FIELDS,
+}
+
 # --------------------------------------------------------------------------- #
 # Helper functions
 # --------------------------------------------------------------------------- #
@@ -39,10 +105,18 @@ def _to_number(txt: str):
     return int(cleaned) if cleaned not in {"", "-"} else None
 
 
-def _search(pattern: str, text: str):
-    """Utility for one-line numeric extraction."""
-    match = re.search(pattern, text, re.IGNORECASE | re.MULTILINE)
-    return _to_number(match.group(1)) if match else None
+def _scan(text: str, found: dict):
+    """Search text for the _FIELDS not yet in found; first match wins.
+
+    Captured strings are added to found in place. Returns how many fields
+    have been found so far.
+    """
+    for name, pattern in _FIELDS.items():
+        if name not in found:
+            match = pattern.search(text)
+            if match:
+                found[name] = match.group(1)
+    return len(found)
 
 
 # --------------------------------------------------------------------------- #
@@ -51,18 +125,35 @@ def _search(pattern: str, text: str):
 
 def parse_form_990(pdf_path: Path):
     doc = fitz.open(pdf_path)
-    full_text = "\n".join(page.get_text() for page in doc)
+
+    # Scan each page as it is extracted, without joining the pages into one
+    # string, and stop reading once every field, page pattern and yes/no
+    # phrase has been seen. A match that would span a page break is not found.
+    found = {}
+    matches = {}
+    flags = dict.fromkeys(_FLAG_PATTERNS, False)
+    for page in doc:
+        text = page.get_text()
+        for name, pattern in _PAGE_PATTERNS.items():
+            if name not in matches:
+                match = pattern.search(text)
+                if match:
+                    matches[name] = match
+        for name, pattern in _FLAG_PATTERNS.items():
+            if not flags[name] and pattern.search(text):
+                flags[name] = True
+        if (_scan(text, found) == len(_FIELDS) and len(matches) == len(_PAGE_PATTERNS)
+                and all(flags.values())):
+            break
+
     # Organization name & mission (quick ‑ may be refined)
-    org_match = re.search(r"^\s*([A-Z][A-Z\s&',.-]+)\s*Name of organization", full_text, re.MULTILINE)
-    mission_match = re.search(r"mission['’]s?[^:]*:[\s\n]*(.+?)\n", full_text, re.IGNORECASE)
+    org_match = matches.get("organization_name")
+    mission_match = matches.get("mission")
     org_name = org_match.group(1).title().strip() if org_match else None
     mission = mission_match.group(1).strip().rstrip(".") if mission_match else None
 
-    # Fiscal year (first line of Part I)
-    fy_match = re.search(
-        r"for the (\d{4}) calendar year, or tax year beginning (\d{2})-(\d{2})-(\d{4})[ ,]+and ending (\d{2})-(\d{2})-(\d{4})",
-        full_text,
-    )
+    # Fiscal year (first line of Part I)
+    fy_match = matches.get("fiscal_year")
     if fy_match:
         fy_start = f"{fy_match.group(4)}-{fy_match.group(2)}-{fy_match.group(3)}"
         fy_end = f"{fy_match.group(7)}-{fy_match.group(5)}-{fy_match.group(6)}"
@@ -70,44 +161,49 @@ def parse_form_990(pdf_path: Path):
     else:
         fiscal_year = None
 
+    numbers = {name: _to_number(found.get(name)) for name in _FIELDS}
+    for name in _PAIRED_FIELDS:
+        match = matches.get(name)
+        numbers[name] = _to_number(match.group(1)) if match else None
+
     data = {
         "organization_name": org_name,
         "fiscal_year": fiscal_year,
         "mission": mission,
-        "website": _search(r"Website:\s*([\w.:-]+)", full_text),
-        "gross_receipts": _search(r"Gross\s+receipts\s*\$?\s*([\d,]+)", full_text),
-        "total_revenue": _search(r"Total\s+revenue[^\n]*\n[^\d-]*([\d,]+)", full_text),
-        "total_expenses": _search(r"Total\s+expenses[^\n]*\n[^\d-]*([\d,]+)", full_text),
-        "revenue_less_expenses": _search(r"Revenue\s+less\s+expenses[^\n]*\n[^\d-]*([\d,()-]+)", full_text),
-        "contributions_and_grants": _search(r"Contributions\s+and\s+grants[^\n]*\n[^\d-]*([\d,]+)", full_text),
-        "program_service_revenue": _search(r"Program\s+service\s+revenue[^\n]*\n[^\d-]*([\d,]+)", full_text),
-        "investment_income": _search(r"Investment\s+income[^\n]*\n[^\d-]*([\d,]+)", full_text),
-        "other_revenue": _search(r"Other\s+revenue[^\n]*\n[^\d-]*([-\d,]+)", full_text),
-        "grants_and_similar_amounts_paid": _search(r"Grants\s+and\s+similar\s+amounts\s+paid[^\n]*\n[^\d-]*([\d,]+)", full_text),
-        "salaries_and_employee_benefits": _search(r"Salaries.*?employee\s+benefits[^\n]*\n[^\d-]*([\d,]+)", full_text),
-        "other_expenses": _search(r"Other\s+expenses[^\n]*\n[^\d-]*([\d,]+)", full_text),
-        "fundraising_expenses": _search(r"fundraising\s+expenses[^\n]*\n[^\d-]*([\d,]+)", full_text),
-        "total_assets_beginning": _search(r"Total\s+assets[^\n]*\n[^\d-]*([\d,]+)\s+\n+[^\n]*End", full_text),
-        "total_assets_end": _search(r"Total\s+assets[^\n]*End[^\d-]*([\d,]+)", full_text),
-        "total_liabilities_beginning": _search(r"Total\s+liabilities[^\n]*\n[^\d-]*([\d,]+)\s+\n+[^\n]*End", full_text),
-        "total_liabilities_end": _search(r"Total\s+liabilities[^\n]*End[^\d-]*([\d,]+)", full_text),
-        "net_assets_beginning": _search(r"Net\s+assets[^\n]*\n[^\d-]*([\d,]+)\s+\n+[^\n]*End", full_text),
-        "net_assets_end": _search(r"Net\s+assets[^\n]*End[^\d-]*([\d,]+)", full_text),
-        "number_of_employees": _search(r"individuals\s+employed[^\d]*([\d,]+)", full_text),
-        "number_of_volunteers": _search(r"volunteers[^\d]*([\d,]+)", full_text),
-        # Placeholders – refinements welcome
+        "website": numbers["website"],
+        "gross_receipts": numbers["gross_receipts"],
+        "total_revenue": numbers["total_revenue"],
+        "total_expenses": numbers["total_expenses"],
+        "revenue_less_expenses": numbers["revenue_less_expenses"],
+        "contributions_and_grants": numbers["contributions_and_grants"],
+        "program_service_revenue": numbers["program_service_revenue"],
+        "investment_income": numbers["investment_income"],
+        "other_revenue": numbers["other_revenue"],
+        "grants_and_similar_amounts_paid": numbers["grants_and_similar_amounts_paid"],
+        "salaries_and_employee_benefits": numbers["salaries_and_employee_benefits"],
+        "other_expenses": numbers["other_expenses"],
+        "fundraising_expenses": numbers["fundraising_expenses"],
+        "total_assets_beginning": numbers["total_assets_beginning"],
+        "total_assets_end": numbers["total_assets_end"],
+        "total_liabilities_beginning": numbers["total_liabilities_beginning"],
+        "total_liabilities_end": numbers["total_liabilities_end"],
+        "net_assets_beginning": numbers["net_assets_beginning"],
+        "net_assets_end": numbers["net_assets_end"],
+        "number_of_employees": numbers["number_of_employees"],
+        "number_of_volunteers": numbers["number_of_volunteers"],
+        # Placeholders – refinements welcome
         "largest_program_expenses": {},
-        "unrelated_business_income": _search(r"Total\s+unrelated\s+business\s+revenue[^\d]*([\d,]+)", full_text),
-        "net_unrelated_business_income": _search(r"Net\s+unrelated\s+business\s+taxable\s+income[^\d]*([\d,]+)", full_text),
-        "investment_in_securities": bool(re.search(r"investments—other\s+securities", full_text, re.IGNORECASE)),
-        "land_buildings_and_equipment": bool(re.search(r"amount\s+for\s+land,\s+buildings,\s+and\s+equipment", full_text, re.IGNORECASE)),
+        "unrelated_business_income": numbers["unrelated_business_income"],
+        "net_unrelated_business_income": numbers["net_unrelated_business_income"],
+        "investment_in_securities": flags["investment_in_securities"],
+        "land_buildings_and_equipment": flags["land_buildings_and_equipment"],
         "policies": {
             "conflict_of_interest_policy": None,
             "whistleblower_policy": None,
             "document_retention_policy": None,
             "compensation_review_process": None
         },
-        "audited_financials": bool(re.search(r"independent\s+audited\s+financial\s+statements", full_text, re.IGNORECASE)),
+        "audited_financials": flags["audited_financials"],
         "top_individual_salaries": {},
         "foreign_grants": None,
         "domestic_grants": None,
@@ -117,13 +213,38 @@ def parse_form_990(pdf_path: Path):
     }
     return data
 
+
+def parse_many(paths: list, workers: int = os.cpu_count()):
+    """Parse several Form 990 PDFs in parallel, one worker process per core.
+
+    Parsing is CPU-bound regex and text extraction, so processes (not threads)
+    are needed to use more than one core.
+
+    Yields (path, data, error) for each file as soon as it is parsed, in
+    completion order. A file that fails to parse yields data None and the
+    exception as error; the rest of the batch carries on.
+    """
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(parse_form_990, path): path for path in paths}
+        for future in as_completed(futures):
+            path = futures[future]
+            try:
+                data = future.result()
+            except Exception as e:
+                yield path, None, e
+            else:
+                yield path, data, None
+
 # --------------------------------------------------------------------------- #
 # CLI
 # --------------------------------------------------------------------------- #
 
 def main():
     if len(sys.argv) != 3:
-        sys.exit("Usage: python convert_990_to_json.py input.pdf output.json")
+        sys.exit(
+            "Usage: python convert_990_to_json.py input.pdf output.json\n"
+            "       python convert_990_to_json.py input_dir/ output_dir/"
+        )
 
     pdf_path = Path(sys.argv[1])
     out_path = Path(sys.argv[2])
@@ -131,6 +252,33 @@ def main():
     if not pdf_path.exists():
         sys.exit(f"Input file {pdf_path} does not exist.")
 
+    if pdf_path.is_dir():
+        # Batch mode: convert every PDF in the directory
+        pdf_paths = sorted(pdf_path.glob("*.pdf"))
+        if not pdf_paths:
+            sys.exit(f"No PDF files found in {pdf_path}.")
+        out_path.mkdir(parents=True, exist_ok=True)
+
+        # Write each JSON as soon as its PDF is parsed; one bad file does not
+        # cost the rest of the batch
+        failed = []
+        for path, data, error in parse_many(pdf_paths):
+            if error is not None:
+                failed.append(path)
+                print(f"❌ Failed to parse {path}: {error}")
+                continue
+            json_path = out_path / f"{path.stem}.json"
+            with open(json_path, "w") as f:
+                json.dump(data, f, indent=2)
+            print(f"✅ JSON saved to {json_path}")
+
+        if failed:
+            sys.exit(
+                f"{len(failed)} of {len(pdf_paths)} PDFs failed to parse: "
+                + ", ".join(path.name for path in sorted(failed))
+            )
+        return
+
     data = parse_form_990(pdf_path)
 
     with open(out_path, "w") as f:
@@ -1,12 +1,10 @@
-import json
 from aem_calculator import AEMCalculator
+from main import load_financial_data
 
 def run_validation():
     # Load the financial data
-    with open('data/Episcopal.json', 'r') as f:
-        episcopal_data = json.load(f)
-    with open('data/Haverford.json', 'r') as f:
-        haverford_data = json.load(f)
+    episcopal_data = load_financial_data('data/Episcopal.json')
+    haverford_data = load_financial_data('data/Haverford.json')
     
     calculator = AEMCalculator()
     
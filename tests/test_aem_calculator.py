@@ -0,0 +1,274 @@
+"""Regression tests pinning the AEM scores of the bundled data files.
+
+The expected values match the original, unoptimized calculator to within
+1e-15; every faster code path (NumPy, Numba, batch) must reproduce them.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+import aem_calculator  # noqa: E402
+from aem_calculator import METRICS, AEMCalculator  # noqa: E402
+
+TOL = 1e-12
+
+# Per data file: AEM score, then component scores, sensitivities and
+# contributions in METRICS order
+EXPECTED = {
+    'Episcopal.json': {
+        'score': 0.3996789405665072,
+        'components': [
+            0.9934888196740739,
+            0.10175197101601806,
+            0.8866485876631587,
+            0.7613226150003868,
+            0.04594189357398441,
+            0.04594189357398441,
+        ],
+        'sensitivity': [
+            0.017295433372065017,
+            0.0058417052853037,
+            0.007196595769901226,
+            0.005344487799515463,
+            0.003502346999925965,
+            0.003502346999925965,
+        ],
+        'contributions': [
+            0.29804664590222213,
+            0.020350394203203614,
+            0.13299728814947379,
+            0.11419839225005801,
+            0.004594189357398442,
+            0.004594189357398442,
+        ],
+    },
+    'GiveWell.json': {
+        'score': 0.354407834656336,
+        'components': [
+            0.7010250308642396,
+            0.9773852255167282,
+            0.008513590478176751,
+            0.1318616969356387,
+            0.21116741142475573,
+            0.965828046911984,
+        ],
+        'sensitivity': [
+            0.01009564649149236,
+            0.012215242958046935,
+            0.0051117375986920455,
+            0.0032888591781384258,
+            0.001418222012193826,
+            0.006053665467877722,
+        ],
+        'contributions': [
+            0.21030750925927189,
+            0.19547704510334565,
+            0.0012770385717265126,
+            0.019779254540345806,
+            0.021116741142475574,
+            0.0965828046911984,
+        ],
+    },
+    'Haverford.json': {
+        'score': 0.40628240085516787,
+        'components': [
+            0.9585892447085379,
+            0.0033910891345510087,
+            0.9659070790734592,
+            0.5669494577800807,
+            0.3691059596411762,
+            0.3691059596411762,
+        ],
+        'sensitivity': [
+            0.016086607102525297,
+            0.007899829641580758,
+            0.008270315441649578,
+            0.00237439000381634,
+            0.00036808357637618805,
+            0.00036808357637618805,
+        ],
+        'contributions': [
+            0.2875767734125614,
+            0.0006782178269102018,
+            0.14488606186101888,
+            0.08504241866701209,
+            0.03691059596411762,
+            0.03691059596411762,
+        ],
+    },
+    'SSA.json': {
+        'score': 0.29995116932979243,
+        'components': [
+            0.12354564104353476,
+            0.9310050173420279,
+            0.17405283053202106,
+            0.31390205900313567,
+            0.027572249628695592,
+            0.9948271250562454,
+        ],
+        'sensitivity': [
+            0.005138025095716259,
+            0.012373604862985055,
+            0.0018605665832183704,
+            0.00020617078334989047,
+            0.002696820987139581,
+            0.0068799599576876425,
+        ],
+        'contributions': [
+            0.03706369231306043,
+            0.1862010034684056,
+            0.026107924579803158,
+            0.047085308850470346,
+            0.0027572249628695592,
+            0.09948271250562454,
+        ],
+    },
+    'Sewickley.json': {
+        'score': 0.3050487098584928,
+        'components': [
+            0.1432247916038483,
+            0.4940414910104543,
+            0.6312345474379235,
+            0.029363165965582375,
+            0.21763564554135537,
+            0.9976542188759209,
+        ],
+        'sensitivity': [
+            0.004713318007416867,
+            0.0037057408069012254,
+            0.0048204803583166145,
+            0.004074170599402682,
+            0.0008654758843280597,
+            0.006857480287301321,
+        ],
+        'contributions': [
+            0.04296743748115449,
+            0.09880829820209086,
+            0.09468518211568852,
+            0.004404474894837356,
+            0.02176356455413554,
+            0.09976542188759209,
+        ],
+    },
+}
+
+
+def _load(name):
+    with open(ROOT / 'data' / name, encoding='utf-8') as file:
+        return json.load(file)
+
+
+@pytest.fixture
+def calculator():
+    return AEMCalculator()
+
+
+@pytest.mark.parametrize('name', sorted(EXPECTED))
+def test_calculate_aem(calculator, name):
+    expected = EXPECTED[name]
+    score, components = calculator.calculate_aem(_load(name))
+    assert score == pytest.approx(expected['score'], rel=0, abs=TOL)
+    assert list(components) == list(METRICS)
+    assert list(components.values()) == pytest.approx(expected['components'], rel=0, abs=TOL)
+
+
+@pytest.mark.parametrize('name', sorted(EXPECTED))
+def test_sensitivity_analysis(calculator, name):
+    sensitivity = calculator.sensitivity_analysis(_load(name))
+    assert list(sensitivity) == list(METRICS)
+    assert list(sensitivity.values()) == pytest.approx(EXPECTED[name]['sensitivity'], rel=0, abs=TOL)
+
+
+@pytest.mark.parametrize('name', sorted(EXPECTED))
+def test_analyze_components(calculator, name):
+    expected = EXPECTED[name]
+    analysis = calculator.analyze_components(_load(name))
+    assert analysis['total_score'] == pytest.approx(expected['score'], rel=0, abs=TOL)
+    assert list(analysis['component_scores'].values()) == pytest.approx(expected['components'], rel=0, abs=TOL)
+    assert list(analysis['contributions'].values()) == pytest.approx(expected['contributions'], rel=0, abs=TOL)
+
+
+def test_calculate_aem_batch(calculator):
+    names = sorted(EXPECTED)
+    scores, components = calculator.calculate_aem_batch([_load(name) for name in names])
+    assert scores.shape == (len(names),)
+    assert components.shape == (len(names), len(METRICS))
+    for name, score, row in zip(names, scores, components):
+        assert score == pytest.approx(EXPECTED[name]['score'], rel=0, abs=TOL)
+        assert row.tolist() == pytest.approx(EXPECTED[name]['components'], rel=0, abs=TOL)
+
+
+def test_flat_metrics_score_one_half(calculator):
+    flat = np.full(len(METRICS), 0.7)
+    score, components = calculator.calculate_aem({}, _raw=flat)
+    assert score == 0.5
+    assert list(components.values()) == [0.5] * len(METRICS)
+
+    scores, normalized = calculator._score_batch(np.tile(flat, (3, 1)))
+    assert scores == pytest.approx([0.5] * 3, rel=0, abs=TOL)
+    assert (normalized == 0.5).all()
+
+
+class _RecordingArrayModule:
+    """Stand-in for CuPy's array module: delegates to NumPy and records each call."""
+
+    def __init__(self):
+        self.calls = set()
+
+    def __getattr__(self, name):
+        self.calls.add(name)
+        return getattr(np, name)
+
+
+class _FakeCupy:
+    """Just enough of the cupy namespace for calculate_aem_batch_gpu."""
+
+    @staticmethod
+    def asarray(array):
+        return np.array(array)
+
+    @staticmethod
+    def asnumpy(array):
+        return np.asarray(array)
+
+
+@pytest.fixture
+def fake_device(monkeypatch):
+    """Route the array-module dispatch to a recording NumPy-backed fake."""
+    xp = _RecordingArrayModule()
+    monkeypatch.setattr(aem_calculator, '_import_cupy', lambda: _FakeCupy)
+    monkeypatch.setattr(aem_calculator, '_array_module', lambda x: xp)
+    monkeypatch.setattr(aem_calculator, '_gpu_expit', lambda x: 1.0 / (1.0 + np.exp(-x)))
+    return xp
+
+
+def test_score_batch_dispatches_on_array_module(calculator, fake_device):
+    names = sorted(EXPECTED)
+    raw = calculator._extract_raw_metrics_batch([_load(name) for name in names])
+    scores, normalized = calculator._score_batch(raw)
+    assert scores.tolist() == pytest.approx([EXPECTED[name]['score'] for name in names], rel=0, abs=TOL)
+    assert normalized.tolist() == [
+        pytest.approx(EXPECTED[name]['components'], rel=0, abs=TOL) for name in names
+    ]
+    assert {'asarray', 'einsum', 'sqrt', 'where', 'clip', 'all', 'log', 'log1p'} <= fake_device.calls
+
+
+def test_calculate_aem_batch_gpu(calculator, fake_device):
+    names = sorted(EXPECTED)
+    scores, normalized = calculator.calculate_aem_batch_gpu([_load(name) for name in names])
+    assert isinstance(scores, np.ndarray)
+    assert normalized.shape == (len(names), len(METRICS))
+    assert scores.tolist() == pytest.approx([EXPECTED[name]['score'] for name in names], rel=0, abs=TOL)
+
+
+def test_calculate_aem_batch_gpu_without_cupy(calculator, monkeypatch):
+    monkeypatch.setattr(aem_calculator, '_import_cupy', lambda: None)
+    with pytest.raises(ImportError, match='CuPy'):
+        calculator.calculate_aem_batch_gpu([_load(sorted(EXPECTED)[0])])
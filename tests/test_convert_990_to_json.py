@@ -0,0 +1,190 @@
+"""Tests for the page-by-page Form 990 parser in pipeline/convert_990_to_json.py.
+
+PyMuPDF is replaced by a stub ``fitz`` module; each test hands the parser a
+list of page texts directly.
+"""
+
+import importlib.util
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+
+def _load_converter():
+    """Import the converter with a stub fitz in sys.modules."""
+    saved = sys.modules.get('fitz')
+    sys.modules['fitz'] = types.ModuleType('fitz')
+    try:
+        spec = importlib.util.spec_from_file_location(
+            'convert_990_to_json', ROOT / 'pipeline' / 'convert_990_to_json.py')
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+    finally:
+        if saved is None:
+            del sys.modules['fitz']
+        else:
+            sys.modules['fitz'] = saved
+    return module
+
+
+convert = _load_converter()
+
+FISCAL_YEAR_LINE = (
+    "for the 2022 calendar year, or tax year beginning 07-01-2022 , and ending 06-30-2023\n"
+)
+
+SUMMARY_PAGE = (
+    "Form 990\n"
+    + FISCAL_YEAR_LINE
+    + "  EPISCOPAL ACADEMY   Name of organization\n"
+    "Mission's statement:\n"
+    "Co-educational day school.\n"
+    "Gross receipts $ 76,212,402\n"
+    "8 Contributions and grants (Part VIII, line 1h)\n 20,039,728\n"
+    "9 Program service revenue (Part VIII, line 2g)\n 47,090,875\n"
+    "10 Investment income (Part VIII)\n 3,612,017\n"
+    "11 Other revenue (Part VIII)\n -48,868\n"
+    "12 Total revenue add lines\n 70,693,752\n"
+    "13 Grants and similar amounts paid (Part IX)\n 8,986,092\n"
+    "15 Salaries, other compensation, employee benefits (Part IX)\n 32,897,859\n"
+    "16b Total fundraising expenses (Part IX)\n 2,979,997\n"
+    "17 Other expenses (Part IX)\n 15,665,015\n"
+    "18 Total expenses. Add lines\n 57,548,966\n"
+    "19 Revenue less expenses. Subtract\n 13,144,786\n"
+)
+
+BALANCE_PAGE = (
+    "20 Total assets (Part X)\n 285,908,230 \n\n End of Year\n"
+    "22 Total liabilities (Part X)\n 23,861,011 \n\n End\n"
+    " Net assets or fund balances\n 262,047,219 \n\n End 278,927,337\n"
+    "Total assets, End of Year 301,337,112\n"
+    "Total liabilities, End of Year 22,409,775\n"
+    "Net assets or fund balances, End of Year 278,927,337\n"
+    "Total number of individuals employed 551\n"
+    "Number of volunteers 1,149\n"
+    "Total unrelated business revenue 90,851\n"
+    "Net unrelated business taxable income 0\n"
+    "Website: 12\n"
+)
+
+FLAGS_PAGE = (
+    "Investments—other securities\n"
+    "Amount for land, buildings, and equipment\n"
+    "Did the organization obtain independent audited financial statements?\n"
+)
+
+FLAGS = ('investment_in_securities', 'land_buildings_and_equipment', 'audited_financials')
+
+
+class _Page:
+    """Stub PyMuPDF page that records when its text is read."""
+
+    def __init__(self, text, read):
+        self._text = text
+        self._read = read
+
+    def get_text(self, *args, **kwargs):
+        self._read.append(self._text)
+        return self._text
+
+
+def _parse(monkeypatch, pages):
+    """Parse pages with the stub fitz; returns the data and the page texts read."""
+    read = []
+    doc = [_Page(text, read) for text in pages]
+    monkeypatch.setattr(convert, 'fitz', types.SimpleNamespace(open=lambda path: doc), raising=False)
+    return convert.parse_form_990(Path('form990.pdf')), read
+
+
+def _search_joined(pages):
+    """Reference result: one search per field over the joined page texts."""
+    text = "\n".join(pages)
+    expected = {}
+    for name, pattern in {**convert._FIELDS, **convert._PAIRED_FIELDS}.items():
+        match = pattern.search(text)
+        expected[name] = convert._to_number(match.group(1)) if match else None
+    for name, pattern in convert._FLAG_PATTERNS.items():
+        expected[name] = bool(pattern.search(text))
+    org_match = convert._ORG_NAME.search(text)
+    expected['organization_name'] = org_match.group(1).title().strip() if org_match else None
+    mission_match = convert._MISSION.search(text)
+    expected['mission'] = mission_match.group(1).strip().rstrip(".") if mission_match else None
+    return expected
+
+
+@pytest.mark.parametrize('pages', [
+    [SUMMARY_PAGE, BALANCE_PAGE, FLAGS_PAGE],
+    [FLAGS_PAGE, BALANCE_PAGE, SUMMARY_PAGE],
+    [SUMMARY_PAGE],
+    [BALANCE_PAGE, "Total revenue\n 999\n", SUMMARY_PAGE],
+])
+def test_matches_search_over_joined_text(monkeypatch, pages):
+    data, _ = _parse(monkeypatch, pages)
+    for name, value in _search_joined(pages).items():
+        assert data[name] == value, name
+
+
+def test_summary_values(monkeypatch):
+    data, _ = _parse(monkeypatch, [SUMMARY_PAGE, BALANCE_PAGE, FLAGS_PAGE])
+    assert data['organization_name'] == 'Episcopal Academy'
+    assert data['fiscal_year'] == '2022-07-01 to 2023-06-30'
+    assert data['mission'] == 'Co-educational day school'
+    assert data['total_revenue'] == 70693752
+    assert data['total_assets_beginning'] == 285908230
+    assert data['total_assets_end'] == 301337112
+    assert data['net_assets_end'] == 278927337
+    assert data['number_of_volunteers'] == 1149
+
+
+def test_first_match_wins_across_pages(monkeypatch):
+    data, _ = _parse(monkeypatch, [SUMMARY_PAGE, "12 Total revenue\n 999\n", BALANCE_PAGE])
+    assert data['total_revenue'] == 70693752
+
+    data, _ = _parse(monkeypatch, ["12 Total revenue\n 999\n", SUMMARY_PAGE, BALANCE_PAGE])
+    assert data['total_revenue'] == 999
+
+
+def test_value_on_late_page(monkeypatch):
+    pages = [SUMMARY_PAGE, BALANCE_PAGE] + ["Schedule continued\n"] * 5 + ["Total unrelated business revenue 42\n"]
+    pages[1] = pages[1].replace("Total unrelated business revenue 90,851\n", "")
+    data, _ = _parse(monkeypatch, pages)
+    assert data['unrelated_business_income'] == 42
+
+
+def test_stops_reading_once_everything_is_found(monkeypatch):
+    pages = [SUMMARY_PAGE, BALANCE_PAGE, FLAGS_PAGE, "Total revenue\n 999\n"]
+    _, read = _parse(monkeypatch, pages)
+    assert read == pages[:3]
+
+
+def test_early_exit_waits_for_page_patterns(monkeypatch):
+    # Every scanned field and yes/no phrase is found by page 3; the fiscal
+    # year only appears on page 4
+    pages = [SUMMARY_PAGE.replace(FISCAL_YEAR_LINE, ""), BALANCE_PAGE, FLAGS_PAGE,
+             FISCAL_YEAR_LINE, "Total revenue\n 999\n"]
+    data, read = _parse(monkeypatch, pages)
+    assert data['fiscal_year'] == '2022-07-01 to 2023-06-30'
+    assert read == pages[:4]
+
+
+def test_yes_no_phrases(monkeypatch):
+    data, _ = _parse(monkeypatch, [SUMMARY_PAGE, BALANCE_PAGE])
+    assert [data[name] for name in FLAGS] == [False, False, False]
+
+    data, _ = _parse(monkeypatch, [SUMMARY_PAGE, BALANCE_PAGE, "Continued\n", FLAGS_PAGE])
+    assert [data[name] for name in FLAGS] == [True, True, True]
+
+    data, _ = _parse(monkeypatch, [SUMMARY_PAGE, "INDEPENDENT AUDITED FINANCIAL STATEMENTS\n"])
+    assert [data[name] for name in FLAGS] == [False, False, True]
+
+
+def test_non_breaking_space(monkeypatch):
+    pages = ["EPISCOPAL\xa0ACADEMY Name of organization\n",
+             "Total assets\n 100,000\xa0\n\nEnd\n"]
+    data, _ = _parse(monkeypatch, pages)
+    assert data['organization_name'] == 'Episcopal\xa0Academy'
+    assert data['total_assets_beginning'] == 100000